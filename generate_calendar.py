@@ -29,23 +29,28 @@ Version: 2.0
 
 try:
     from docx import Document
-    from docx.shared import Pt, Inches, RGBColor
+    from docx.shared import Emu, Pt, Inches, RGBColor
     from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.enum.table import WD_TABLE_ALIGNMENT
     from docx.enum.section import WD_ORIENT
     from docx.oxml.ns import qn
     from docx.oxml import OxmlElement
+    from lxml.etree import SubElement
 except ImportError:
     print("Error: The 'python-docx' library is required but not installed.")
     print("Please install it using: pip install python-docx")
     sys.exit(1)
 
 import calendar
+import copy
 import sys
 import datetime
 from datetime import date, timedelta
+from collections import defaultdict
+from functools import lru_cache
 
 # Function to calculate the date of Easter for a given year using the Meeus/Jones/Butcher algorithm
+@lru_cache(maxsize=8)
 def calculate_easter(year):
     a = year % 19  # Golden number (position in 19-year Metonic cycle)
     b = year // 100  # Century
@@ -63,262 +68,292 @@ def calculate_easter(year):
     day = ((h + l - 7 * m + 114) % 31) + 1  # Day of the month
     return date(year, month, day)
 
-# Function to get the first Sunday of a given month and year
-def first_sunday(year, month):
+# Function to get the nth given weekday (0=Monday, 6=Sunday) of a month and year, or the last one when n is -1
+def nth_weekday(year, month, weekday, n):
+    if n == -1:
+        last_day = date(year, month, calendar.monthrange(year, month)[1])
+        return last_day - timedelta(days=(last_day.weekday() - weekday) % 7)
     first_day = date(year, month, 1)
-    weekday = first_day.weekday()  # 0=Monday, 6=Sunday
-    days_to_sunday = (6 - weekday) % 7
-    return first_day + timedelta(days=days_to_sunday)
-
-# Function to get the holiday names for a given date, if any
-def get_holiday_name(d):
-    holidays = []
-    
-    # US Federal Holidays
-    if d.month == 1 and d.day == 1:
-        holidays.append("New Year's Day")
-    if d.month == 1 and d.weekday() == 0:  # Monday
-        # Third Monday in January
-        jan1 = date(d.year, 1, 1)
-        first_mon = jan1 + timedelta(days=(7 - jan1.weekday()) % 7)
-        third_mon = first_mon + timedelta(days=14)
-        if d == third_mon:
-            holidays.append("Martin Luther King Jr. Day")
-    if d.month == 2 and d.weekday() == 0:  # Monday
-        # Third Monday in February
-        feb1 = date(d.year, 2, 1)
-        first_mon = feb1 + timedelta(days=(7 - feb1.weekday()) % 7)
-        third_mon = first_mon + timedelta(days=14)
-        if d == third_mon:
-            holidays.append("Presidents' Day")
-    if d.month == 5 and d.weekday() == 0:  # Monday
-        # Last Monday in May
-        may31 = date(d.year, 5, 31)
-        last_mon = may31 - timedelta(days=may31.weekday())
-        if d == last_mon:
-            holidays.append("Memorial Day")
-    if d.month == 7 and d.day == 4:
-        holidays.append("Independence Day")
-    if d.month == 9 and d.weekday() == 0:  # Monday
-        # First Monday in September
-        sep1 = date(d.year, 9, 1)
-        first_mon = sep1 + timedelta(days=(7 - sep1.weekday()) % 7)
-        if d == first_mon:
-            holidays.append("Labor Day")
-    if d.month == 10 and d.weekday() == 0:  # Monday
-        # Second Monday in October
-        oct1 = date(d.year, 10, 1)
-        first_mon = oct1 + timedelta(days=(7 - oct1.weekday()) % 7)
-        second_mon = first_mon + timedelta(days=7)
-        if d == second_mon:
-            holidays.append("Columbus Day")
-    if d.month == 11 and d.day == 11:
-        holidays.append("Veterans Day")
-    if d.month == 11 and d.weekday() == 3:  # Thursday
-        # Fourth Thursday in November
-        nov1 = date(d.year, 11, 1)
-        first_thu = nov1 + timedelta(days=(3 - nov1.weekday()) % 7)
-        fourth_thu = first_thu + timedelta(days=21)
-        if d == fourth_thu:
-            holidays.append("Thanksgiving")
-    if d.month == 12 and d.day == 25:
-        holidays.append("Christmas")
-    if d.month == 3 and d.day == 31:
-        holidays.append("Cesar Chavez Day")
-
-    # Christian Holidays
-    easter = calculate_easter(d.year)
-    if d == easter - timedelta(days=2):
-        holidays.append("Good Friday")
-    if d == easter:
-        holidays.append("Easter")
-    if d == easter + timedelta(days=49):
-        holidays.append("Pentecost")
-    # Mother's Day: Second Sunday in May
-    if d.month == 5 and d.weekday() == 6:  # Sunday
-        may1 = date(d.year, 5, 1)
-        first_sun = may1 + timedelta(days=(6 - may1.weekday()) % 7)
-        second_sun = first_sun + timedelta(days=7)
-        if d == second_sun:
-            holidays.append("Mother's Day")
-    # Father's Day: Third Sunday in June
-    if d.month == 6 and d.weekday() == 6:  # Sunday
-        jun1 = date(d.year, 6, 1)
-        first_sun_jun = jun1 + timedelta(days=(6 - jun1.weekday()) % 7)
-        third_sun_jun = first_sun_jun + timedelta(days=14)
-        if d == third_sun_jun:
-            holidays.append("Father's Day")
-
-    # LDS Church Holidays
-    april_sunday = first_sunday(d.year, 4)
-    oct_sunday = first_sunday(d.year, 10)
-    if d == april_sunday - timedelta(days=1) or d == april_sunday:
-        holidays.append("General Conference")
-    if d == oct_sunday - timedelta(days=1) or d == oct_sunday:
-        holidays.append("General Conference")
-    if d.month == 7 and d.day == 24:
-        holidays.append("Pioneer Day")
-
-    # LDS Church History Events
-    if d.month == 9 and d.day == 21:
-        holidays.append("First Vision")
-    if d.month == 4 and d.day == 6:
-        holidays.append("Church Organization")
-    if d.month == 3 and d.day == 27:
-        holidays.append("Kirtland Temple Dedication")
-    if d.month == 4 and d.day == 3:
-        holidays.append("First Presidency Organized")
-    if d.month == 6 and d.day == 27:
-        holidays.append("Joseph Smith Martyrdom")
-
-    return holidays
-
-# Parse command line arguments to determine the year for the calendar
-if len(sys.argv) > 1:
-    try:
-        year = int(sys.argv[1])  # Attempt to convert the argument to an integer
-    except ValueError:
-        print("Error: Year must be a valid integer")  # Inform user of invalid input
-        sys.exit(1)  # Exit the program with error code
-else:
-    year = datetime.datetime.now().year  # Default to the current year if no argument is provided
-
-# Initialize a new Word document
-doc = Document()
-doc.core_properties.title = f"{year} Calendar - Writable Version"  # Set the document title
-
-# Configure the calendar module to start weeks on Sunday (default is Monday)
-calendar.setfirstweekday(calendar.SUNDAY)
-
-# Configure the document's page layout for landscape orientation
-section = doc.sections[0]
-section.orientation = WD_ORIENT.LANDSCAPE  # Change to landscape mode
-section.page_width = Inches(11)  # Standard letter width in landscape
-section.page_height = Inches(8.5)  # Standard letter height in landscape
-section.top_margin = Inches(0.1)  # Minimal top margin
-section.bottom_margin = Inches(0.1)  # Minimal bottom margin
-section.left_margin = Inches(0.5)  # Left margin
-section.right_margin = Inches(0.5)  # Right margin
-
-# Loop through each month (1 to 12) to create a page for each
-for month in range(1, 13):
+    return first_day + timedelta(days=(weekday - first_day.weekday()) % 7 + 7 * (n - 1))
+
+# US federal holidays on fixed dates, keyed by (month, day)
+_FEDERAL_FIXED_HOLIDAYS = {
+    (1, 1): "New Year's Day",
+    (7, 4): "Independence Day",
+    (11, 11): "Veterans Day",
+    (12, 25): "Christmas",
+    (3, 31): "Cesar Chavez Day",
+}
+
+# Christian holidays relative to Easter, keyed by offset in days
+_EASTER_HOLIDAYS = {
+    -2: "Good Friday",
+    0: "Easter",
+    49: "Pentecost",
+}
+
+# Holidays on the nth weekday of a month, keyed by (month, weekday, n) with 0=Monday and n=-1 for the last one
+_NTH_WEEKDAY_HOLIDAYS = {
+    (1, 0, 3): "Martin Luther King Jr. Day",
+    (2, 0, 3): "Presidents' Day",
+    (5, 0, -1): "Memorial Day",
+    (9, 0, 1): "Labor Day",
+    (10, 0, 2): "Columbus Day",
+    (11, 3, 4): "Thanksgiving",
+    (5, 6, 2): "Mother's Day",
+    (6, 6, 3): "Father's Day",
+}
+
+# LDS Church holidays and history events on fixed dates, keyed by (month, day)
+_LDS_FIXED_HOLIDAYS = {
+    (7, 24): "Pioneer Day",
+    (9, 21): "First Vision",
+    (4, 6): "Church Organization",
+    (3, 27): "Kirtland Temple Dedication",
+    (4, 3): "First Presidency Organized",
+    (6, 27): "Joseph Smith Martyrdom",
+}
+
+# Function to build a map of every holiday in a given year, keyed by date
+def build_holiday_map(year):
+    holidays = defaultdict(list)
+
+    # The tables are applied in this order so holidays sharing a date keep a stable listing order
+    for (month, day), name in _FEDERAL_FIXED_HOLIDAYS.items():
+        holidays[date(year, month, day)].append(name)
+
+    easter = calculate_easter(year)
+    for offset, name in _EASTER_HOLIDAYS.items():
+        holidays[easter + timedelta(days=offset)].append(name)
+
+    for (month, weekday, n), name in _NTH_WEEKDAY_HOLIDAYS.items():
+        holidays[nth_weekday(year, month, weekday, n)].append(name)
+
+    # General Conference: the first Saturday and Sunday in April and October
+    for month in (4, 10):
+        conference_sunday = nth_weekday(year, month, 6, 1)
+        holidays[conference_sunday - timedelta(days=1)].append("General Conference")
+        holidays[conference_sunday].append("General Conference")
+
+    for (month, day), name in _LDS_FIXED_HOLIDAYS.items():
+        holidays[date(year, month, day)].append(name)
+
+    # Freeze into a plain dict of tuples, matching the empty-tuple default used for lookups
+    return {d: tuple(names) for d, names in holidays.items()}
+
+# Function to build a border definition that hides every table border
+def _make_tbl_borders_template():
+    tblBorders = OxmlElement('w:tblBorders')
+    for border_name in ["top", "left", "bottom", "right", "insideH", "insideV"]:
+        border = OxmlElement(f'w:{border_name}')
+        border.set(qn('w:val'), 'none')
+        tblBorders.append(border)
+    return tblBorders
+
+# Template table border definition, built once and copied per table
+_TBL_BORDERS_TEMPLATE = _make_tbl_borders_template()
+
+# Function to remove all borders from the table for a clean look
+def remove_table_borders(table):
+    tbl = table._tbl
+    tblPr = tbl.tblPr
+    if tblPr is None:
+        tblPr = OxmlElement('w:tblPr')
+        tbl.insert(0, tblPr)
+    tblPr.append(copy.deepcopy(_TBL_BORDERS_TEMPLATE))
+
+# Function to build a thin gray cell border definition
+def _make_tc_borders_template():
+    tcBorders = OxmlElement('w:tcBorders')
+    for border_name in ["top", "left", "bottom", "right"]:
+        border = OxmlElement(f'w:{border_name}')
+        border.set(qn('w:val'), 'single')
+        border.set(qn('w:sz'), '4')   # 4 = 0.5 pt
+        border.set(qn('w:color'), 'D3D3D3')
+        tcBorders.append(border)
+    return tcBorders
+
+# Template cell border definition, built once and copied per cell
+_TC_BORDERS_TEMPLATE = _make_tc_borders_template()
+
+# Function to add thin gray borders to individual cells
+def add_cell_borders(cell):
+    tcPr = cell._element.tcPr
+    if tcPr is None:
+        tcPr = OxmlElement('w:tcPr')
+        cell._element.insert(0, tcPr)
+    tcPr.append(copy.deepcopy(_TC_BORDERS_TEMPLATE))
+
+# Shared measurements and colors, built once and reused for every month
+_W_CELL = Inches(1.4)  # Column width adjusted for landscape layout
+_H_ROW = Inches(1.0)  # Row height leaving space for writing notes
+_PT0 = Pt(0)
+_PT6 = Pt(6)
+_PT10 = Pt(10)
+_PT12 = Pt(12)
+_PT18 = Pt(18)
+_PT36 = Pt(36)
+_ORANGE = RGBColor(230, 138, 0)  # Warm orange for weekends
+_HEADER_GRAY = RGBColor(80, 80, 80)  # Gray color for headers
+_BLACK = RGBColor(0, 0, 0)
+
+# Function to build paragraph properties with the given alignment and optional spacing before/after
+def _make_ppr_template(alignment, space_before=None, space_after=None):
+    pPr = OxmlElement('w:pPr')
+    if space_before is not None or space_after is not None:
+        spacing = SubElement(pPr, qn('w:spacing'))
+        if space_before is not None:
+            spacing.set(qn('w:before'), str(space_before.twips))
+        if space_after is not None:
+            spacing.set(qn('w:after'), str(space_after.twips))
+    SubElement(pPr, qn('w:jc')).set(qn('w:val'), alignment)  # w:jc follows w:spacing in the schema
+    return pPr
+
+# Function to build run properties with the given font size and optional bold, italic and color
+def _make_rpr_template(size, bold=False, italic=False, color=None):
+    rPr = OxmlElement('w:rPr')
+    # Children must follow the schema order: b, i, color, sz
+    if bold:
+        SubElement(rPr, qn('w:b'))
+    if italic:
+        SubElement(rPr, qn('w:i'))
+    if color is not None:
+        SubElement(rPr, qn('w:color')).set(qn('w:val'), str(color))
+    SubElement(rPr, qn('w:sz')).set(qn('w:val'), str(int(size.pt * 2)))  # Half-points
+    return rPr
+
+# Template paragraph and run properties, built once and copied per cell
+_DAY_PPR_TEMPLATE = _make_ppr_template('left', space_before=_PT6, space_after=_PT0)  # 6 pt top padding
+_HEADER_PPR_TEMPLATE = _make_ppr_template('center')
+_HEADER_RPR_TEMPLATE = _make_rpr_template(_PT12, bold=True, color=_HEADER_GRAY)  # Weekday headers
+_DAY_RPR_TEMPLATE = _make_rpr_template(_PT18, bold=True)  # Day number
+_WEEKEND_RPR_TEMPLATE = _make_rpr_template(_PT18, bold=True, color=_ORANGE)  # Weekend day number
+_HOLIDAY_RPR_TEMPLATE = _make_rpr_template(_PT10, italic=True)  # Holiday names
+
+# Function to write the day number and any holiday names into a day cell's paragraph
+def add_day_runs(p, day, holidays, weekend):
+    run = SubElement(p, qn('w:r'))
+    run.append(copy.deepcopy(_WEEKEND_RPR_TEMPLATE if weekend else _DAY_RPR_TEMPLATE))
+    SubElement(run, qn('w:t')).text = str(day)  # Add the day number
+
+    if holidays:
+        SubElement(run, qn('w:br'))  # Add a line break
+        run2 = SubElement(p, qn('w:r'))
+        run2.append(copy.deepcopy(_HOLIDAY_RPR_TEMPLATE))
+        for i, name in enumerate(holidays):
+            if i:
+                SubElement(run2, qn('w:br'))  # Separate multiple holidays with new lines
+            SubElement(run2, qn('w:t')).text = name
+
+# Function to configure a document's page layout for landscape orientation
+def configure_page_layout(doc):
+    section = doc.sections[0]
+    section.orientation = WD_ORIENT.LANDSCAPE  # Change to landscape mode
+    section.page_width = Inches(11)  # Standard letter width in landscape
+    section.page_height = Inches(8.5)  # Standard letter height in landscape
+    section.top_margin = Inches(0.1)  # Minimal top margin
+    section.bottom_margin = Inches(0.1)  # Minimal bottom margin
+    section.left_margin = Inches(0.5)  # Left margin
+    section.right_margin = Inches(0.5)  # Right margin
+
+# Month names indexed by month number (1 to 12)
+_MONTH_NAMES = list(calendar.month_name)
+
+# Calendar with weeks starting on Sunday (default is Monday)
+_CALENDAR = calendar.Calendar(calendar.SUNDAY)
+
+# Function to add one month's heading and calendar table to a document
+def build_month(doc, year, month, days, holiday_map):
     # Add a centered heading for the month and year
     heading = doc.add_heading(level=0)
-    run = heading.add_run(f"{calendar.month_name[month]} {year}")
-    run.font.size = Pt(36)
+    run = heading.add_run(f"{_MONTH_NAMES[month]} {year}")
+    run.font.size = _PT36
     run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 0, 0)
+    run.font.color.rgb = _BLACK
     heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-    # Create a 7x7 table: 1 row for weekdays, up to 6 rows for weeks
-    table = doc.add_table(rows=7, cols=7)
+    # Create a 7-column table: 1 row for weekdays, plus one row per week in the month (4 to 6)
+    # Built at its final width so every grid column and cell starts at the landscape column width
+    table = doc._body.add_table(1 + len(days) // 7, 7, Emu(_W_CELL * 7))
+    table.style = None  # Inherit the document's default table style, as doc.add_table does
     table.alignment = WD_TABLE_ALIGNMENT.CENTER  # Center the table on the page
     table.allow_autofit = False  # Disable auto-fitting to maintain custom widths
-
-    # Set uniform column widths suitable for landscape orientation
-    for col in table.columns:
-        for cell in col.cells:
-            cell.width = Inches(1.4)  # Width adjusted for landscape layout
-
-    # Define a function to remove all borders from the table for a clean look
-    def remove_table_borders(table):
-        tbl = table._tbl
-        tblPr = tbl.tblPr
-        if tblPr is None:
-            tblPr = OxmlElement('w:tblPr')
-            tbl.insert(0, tblPr)
-        
-        tblBorders = OxmlElement('w:tblBorders')
-        for border_name in ["top", "left", "bottom", "right", "insideH", "insideV"]:
-            border = OxmlElement(f'w:{border_name}')
-            border.set(qn('w:val'), 'none')
-            tblBorders.append(border)
-        tblPr.append(tblBorders)
+    cells = table._cells  # Flat list of all cells, row by row
+    rows = table.rows
 
     remove_table_borders(table)  # Apply the border removal to the current table
 
-    # Define a function to add thin gray borders to individual cells
-    def add_cell_borders(cell):
-        tcPr = cell._element.tcPr
-        if tcPr is None:
-            tcPr = OxmlElement('w:tcPr')
-            cell._element.insert(0, tcPr)
-        
-        tcBorders = OxmlElement('w:tcBorders')
-        for border_name in ["top", "left", "bottom", "right"]:
-            border = OxmlElement(f'w:{border_name}')
-            border.set(qn('w:val'), 'single')
-            border.set(qn('w:sz'), '4')   # 4 = 0.5 pt
-            border.set(qn('w:color'), 'D3D3D3')
-            tcBorders.append(border)
-        tcPr.append(tcBorders)
-
     # Populate the header row with weekday abbreviations
     headers = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
-    hdr_cells = table.rows[0].cells
+    hdr_cells = cells[:7]
     for i, day_name in enumerate(headers):
         cell = hdr_cells[i]
-        p = cell.paragraphs[0]
-        p.text = day_name
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER  # Center the text
-        run = p.runs[0]
-        run.font.size = Pt(12)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(80, 80, 80)  # Gray color for headers
+        p = cell._element.p_lst[0]
+        p.append(copy.deepcopy(_HEADER_PPR_TEMPLATE))  # Center the text
+        run = SubElement(p, qn('w:r'))
+        run.append(copy.deepcopy(_HEADER_RPR_TEMPLATE))  # Bold gray 12 pt for headers
+        SubElement(run, qn('w:t')).text = day_name
         # Add borders to header cells for definition
         add_cell_borders(cell)
 
-    # Get the calendar data for the current month as a list of weeks
-    weeks = calendar.monthcalendar(year, month)
-
-    for week_idx in range(6):  # Up to 6 weeks in a month
-        row_cells = table.rows[week_idx + 1].cells
+    for week_idx, week_start in enumerate(range(0, len(days), 7)):
         # Set row height to provide space for writing notes
-        table.rows[week_idx + 1].height = Inches(1.0)
+        rows[week_idx + 1].height = _H_ROW
 
         for day_idx in range(7):  # 7 days in a week
-            cell = row_cells[day_idx]
-            p = cell.paragraphs[0]
-            p.alignment = WD_ALIGN_PARAGRAPH.LEFT  # Left-align text for notes
-
-            # Add top padding inside the cell for better spacing
-            p.paragraph_format.space_before = Pt(6)
-            p.paragraph_format.space_after = Pt(0)
-
-            if week_idx < len(weeks) and weeks[week_idx][day_idx] != 0:
-                day = weeks[week_idx][day_idx]
-                date_obj = date(year, month, day)
-                holidays = get_holiday_name(date_obj)
-                run = p.add_run(str(day))  # Add the day number
-                run.font.size = Pt(18)
-                run.bold = True
-
-                if holidays:
-                    holiday_text = "\n".join(holidays)
-                    run.add_break()  # Add a line break
-                    run2 = p.add_run(holiday_text)  # Add the holiday names separated by new lines
-                    run2.font.size = Pt(10)
-                    run2.italic = True
-
-                # Highlight weekends in soft orange for visual distinction
-                if day_idx in (0, 6):  # Sunday (0) or Saturday (6)
-                    run.font.color.rgb = RGBColor(230, 138, 0)  # Warm orange
-                
+            cell = cells[7 + week_start + day_idx]
+            p = cell._element.p_lst[0]
+            # Left-align text for notes and add top padding inside the cell for better spacing
+            p.insert(0, copy.deepcopy(_DAY_PPR_TEMPLATE))
+
+            d_year, d_month, day = days[week_start + day_idx]
+            if d_month == month:  # Skip padding days from the neighboring months
+                holidays = holiday_map.get(date(d_year, d_month, day), ())
+                # Highlight weekends, Sunday (0) or Saturday (6), in soft orange for visual distinction
+                add_day_runs(p, day, holidays, day_idx in (0, 6))
+
                 # Add borders only to cells containing dates
                 add_cell_borders(cell)
-            elif week_idx == 0:
-                # Add borders to blank cells at the start of the month (first week only)
-                add_cell_borders(cell)
-            # Other empty cells remain without borders for a clean look
+            # Empty cells remain without borders for a clean look
+
+def main():
+    # Parse command line arguments to determine the year for the calendar
+    if len(sys.argv) > 1:
+        try:
+            year = int(sys.argv[1])  # Attempt to convert the argument to an integer
+        except ValueError:
+            print("Error: Year must be a valid integer")  # Inform user of invalid input
+            sys.exit(1)  # Exit the program with error code
+    else:
+        year = datetime.datetime.now().year  # Default to the current year if no argument is provided
+
+    # Initialize a new Word document
+    doc = Document()
+    doc.core_properties.title = f"{year} Calendar - Writable Version"  # Set the document title
+
+    configure_page_layout(doc)  # Landscape letter pages with narrow margins
+
+    # Compute all holidays for the year once, before building any month pages
+    holiday_map = build_holiday_map(year)
+
+    # Precompute the (year, month, day) shown in every month's grid cell, full weeks from Sunday, before building the pages
+    # (itermonthdays3 never builds date objects, so padding days before year 1 or after 9999 are fine)
+    all_days = [list(_CALENDAR.itermonthdays3(year, m)) for m in range(1, 13)]
+
+    # Loop through each month (1 to 12) to create a page for each
+    for month in range(1, 13):
+        build_month(doc, year, month, all_days[month - 1], holiday_map)
 
-    # Add a page break after each month except the last one
-    if month < 12:
-        doc.add_page_break()
+        # Add a page break after each month except the last one
+        if month < 12:
+            doc.add_page_break()
 
-# Save the completed document to a file
-output_path = f"Calendar_{year}_Writable.docx"
-doc.save(output_path)
+    # Save the completed document to a file
+    output_path = f"Calendar_{year}_Writable.docx"
+    doc.save(output_path)
 
-print(f"Calendar successfully saved as: {output_path}")  # Confirm successful save
+    print(f"Calendar successfully saved as: {output_path}")  # Confirm successful save
 
 
+if __name__ == "__main__":
+    main()